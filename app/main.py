@@ -3,37 +3,123 @@
 import asyncio
 import logging
 
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
 import websockets
 from fastmcp import Client
 
 from autogen.io.websockets import IOWebsockets
 from autogen.mcp import create_toolkit
 
-from .agents import assistant_agent, execution_agent, groupchat_manager, user_proxy
+from .agents import assistant_agent, execution_agent, groupchat, groupchat_manager, user_proxy
 from .services.calendar_service.mcp import mcp as calendar_service
+from .services.session_service.cache import SessionCache
+from .services.session_service.prefetch import PrefetchService
+from .services.session_service.store import SessionStore
 
 
 logger = logging.getLogger(__name__)
 
 def on_connect(iostream: IOWebsockets) -> None:
     logger.info(f"[App] - on_connect(): Connected to client using IOWebsockets {iostream}")
+
+    session_cache = SessionCache.get_instance()
+    session_cache.clear()
+
+    session_id = get_session_id(iostream)
+    state = load_conversation(session_id) if session_id else None
+    resumed = state is not None and resume_conversation(state)
+    if not resumed:
+        groupchat.reset()
+
+    # Warm up context while the user is still typing their first message
+    prefetch = PrefetchService(session_cache)
+    prefetch.start(resumed=resumed)
+
     logger.info("[App] - on_connect(): Receiving message from client.")
 
     async def get_websocket_input(prompt: str):
+        # The previous turn is complete once the user is asked for input again
+        if session_id:
+            checkpoint_conversation(session_id)
         return iostream.input()
 
-    initial_msg = iostream.input()
-    user_proxy.a_get_human_input = get_websocket_input
-
     try:
-        asyncio.run(chat(initial_msg, iostream))
+        initial_msg = iostream.input()
+        user_proxy.a_get_human_input = get_websocket_input
+
+        asyncio.run(chat(initial_msg, iostream, resumed=resumed))
     except websockets.exceptions.ConnectionClosedOK as e:
         logger.info(f"[App] - Client Disconnected (code={e.code})")
     except Exception as e:
         logger.error(f"[App] - Error in Chat Loop: {e}. Please try again.")
+    finally:
+        prefetch.cancel()
+        if session_id and groupchat.messages:
+            checkpoint_conversation(session_id)
+        session_cache.clear()
+
+
+def get_session_id(iostream: IOWebsockets) -> Optional[str]:
+    """Read the session ID the extension passes as a query parameter, e.g. `/ws?session_id=...`."""
+    try:
+        query = parse_qs(urlparse(iostream.websocket.request.path).query)
+        return query.get("session_id", [None])[0]
+    except Exception as e:
+        logger.error(f"[App] - Error reading session ID: {e}")
+
+
+def load_conversation(session_id: str) -> Optional[dict[str, Any]]:
+    try:
+        state = SessionStore.get_instance().load(session_id)
+        if state is not None and not isinstance(state, dict):
+            raise ValueError(f"expected a JSON object, got {type(state).__name__}")
+        return state
+    except Exception as e:
+        logger.error(f"[App] - Error loading session {session_id}, starting a new conversation: {e}")
+
+
+def checkpoint_conversation(session_id: str) -> None:
+    try:
+        SessionStore.get_instance().save(session_id, {
+            "messages": groupchat.messages,
+            "system_message": assistant_agent.system_message,
+            "cache": SessionCache.get_instance().snapshot(),
+        })
+    except Exception as e:
+        logger.error(f"[App] - Error checkpointing session {session_id}: {e}")
+
+
+def resume_conversation(state: dict[str, Any]) -> bool:
+    """Rehydrate the group chat from a checkpoint without generating any replies."""
+    if not state.get("messages"):
+        return False
+
+    try:
+        assistant_agent.update_system_message(state["system_message"])
+        SessionCache.get_instance().restore(state["cache"])
+
+        last_agent, last_message = groupchat_manager.resume(messages=state["messages"], silent=True)
+
+        # resume() holds back the last message to restart the chat with, but the
+        # user's next message restarts it instead, so deliver it like the others
+        for agent in groupchat.agents:
+            if agent is last_agent:
+                agent.send(last_message, groupchat_manager, request_reply=False, silent=True)
+            else:
+                groupchat_manager.send(last_message, agent, request_reply=False, silent=True)
+        groupchat.append(last_message, last_agent)
+    except Exception as e:
+        logger.error(f"[App] - Error resuming conversation, starting a new one: {e}")
+        SessionCache.get_instance().clear()
+        return False
+
+    logger.info(f"[App] - Resumed conversation with {len(groupchat.messages)} messages")
+    return True
 
 
-async def chat(initial_msg: str, iostream: IOWebsockets):
+async def chat(initial_msg: str, iostream: IOWebsockets, resumed: bool = False):
     async with Client(calendar_service) as client:
         session = client.session
         await session.initialize()
@@ -47,6 +133,7 @@ async def chat(initial_msg: str, iostream: IOWebsockets):
             await user_proxy.a_initiate_chat(
                 groupchat_manager,
                 message=initial_msg,
+                clear_history=not resumed,
             )
         except websockets.exceptions.ConnectionClosedOK as e:
             logger.info(f"[App] - Client Disconnected (code={e.code})")
@@ -3,10 +3,14 @@
 import datetime
 import logging
 
+from zoneinfo import ZoneInfo
+
+import tzlocal
 from fastmcp import FastMCP
 
 from .sdk import CalendarSDK
 from .models import CalendarEvent
+from ..session_service.cache import TIME_ZONE_KEY, UPCOMING_EVENTS_KEY, SessionCache
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +27,43 @@ calendar_sdk = CalendarSDK(
     ]
 )
 
+def _parse_event_boundary(boundary: dict, calendar_tz: ZoneInfo) -> datetime.datetime:
+    if boundary.get("dateTime"):
+        return datetime.datetime.fromisoformat(boundary["dateTime"].replace("Z", "+00:00"))
+    # The Calendar API places all-day events at midnight in the calendar's time zone
+    return datetime.datetime.fromisoformat(boundary["date"]).replace(tzinfo=calendar_tz)
+
+
+def get_cached_events(start_time: datetime.datetime, end_time: datetime.datetime = None, limit: int = None):
+    """Serve an events query from the session's warmed-up events, if they cover it.
+
+    Args:
+        start_time: Start of the time range (timezone aware)
+        end_time: End of the time range (timezone aware), or None for an open range
+        limit: Maximum number of events to return, or None for no limit
+
+    Returns:
+        List of raw calendar events, or None if the query must go to the Calendar API
+    """
+
+    cached = SessionCache.get_instance().get(UPCOMING_EVENTS_KEY)
+    if not cached or not cached.get("time_zone") or start_time < datetime.datetime.fromisoformat(cached["time_min"]):
+        return None
+
+    calendar_tz = ZoneInfo(cached["time_zone"])
+    events = [
+        event for event in cached["items"]
+        if _parse_event_boundary(event["end"], calendar_tz) > start_time
+        and (end_time is None or _parse_event_boundary(event["start"], calendar_tz) < end_time)
+    ]
+
+    if limit is not None and len(events) >= limit:
+        return events[:limit]
+    if not cached["complete"] or end_time is None or end_time > datetime.datetime.fromisoformat(cached["time_max"]):
+        return None
+    return events
+
+
 @mcp.resource(uri="events://future/{limit}")
 def get_upcoming_events(limit: int):
     """Retrieve upcoming events.
@@ -34,6 +75,13 @@ def get_upcoming_events(limit: int):
         List of calendar events
     """
 
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+
+    cached_events = get_cached_events(now, limit=int(limit))
+    if cached_events is not None:
+        logger.info(f"[MCP] - Getting Upcoming Events From Session Cache: {cached_events}")
+        return [CalendarEvent(**event).model_dump_json() for event in cached_events]
+
     service = calendar_sdk.resource
 
     # Call the Calendar API
@@ -41,7 +89,7 @@ def get_upcoming_events(limit: int):
         service.events()
         .list(
             calendarId="primary",
-            timeMin=datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+            timeMin=now.isoformat(),
             maxResults=limit,
             singleEvents=True,
             orderBy="startTime",
@@ -67,11 +115,19 @@ def get_events_between_dates(start_time_str: str, end_time_str: str):
     input_date_format = "%Y-%m-%dT%H%M%S"
     output_date_format = "%Y-%m-%dT%H:%M:%SZ"
 
-    service = calendar_sdk.resource
-
     start_time = datetime.datetime.strptime(start_time_str, input_date_format)
     end_time = datetime.datetime.strptime(end_time_str, input_date_format)
 
+    cached_events = get_cached_events(
+        start_time.replace(tzinfo=datetime.timezone.utc),
+        end_time.replace(tzinfo=datetime.timezone.utc),
+    )
+    if cached_events is not None:
+        logger.info(f"[MCP] - Getting Events Between Dates From Session Cache: {start_time} - {end_time}")
+        return [CalendarEvent(**event).model_dump_json() for event in cached_events]
+
+    service = calendar_sdk.resource
+
     # Call the Calendar API
     events = (
         service.events()
@@ -93,7 +149,22 @@ def get_current_datetime() -> str:
     Returns the current date and time in the format "YYYY-MM-DD HH:MM:SS".
     """
     logger.info("[MCP] - Getting Current Datetime")
-    return datetime.datetime.now().astimezone().strftime("%Y-%m-%d %H:%M:%S%z")
+
+    # Pin the time zone for the rest of the conversation, including after a resume.
+    # It is pinned by IANA name, so the offset still follows daylight saving changes.
+    session_cache = SessionCache.get_instance()
+    time_zone = session_cache.get(TIME_ZONE_KEY)
+    try:
+        if time_zone is None:
+            time_zone = tzlocal.get_localzone_name()
+            session_cache.set(TIME_ZONE_KEY, time_zone, ttl=float("inf"))
+        tz = ZoneInfo(time_zone)
+    except Exception as e:
+        logger.error(f"[MCP] - Error resolving time zone {time_zone}: {e}")
+        session_cache.invalidate(TIME_ZONE_KEY)
+        return datetime.datetime.now().astimezone().strftime("%Y-%m-%d %H:%M:%S%z")
+
+    return datetime.datetime.now(tz=tz).strftime("%Y-%m-%d %H:%M:%S%z")
 
 @mcp.tool
 def create_event(event: CalendarEvent) -> CalendarEvent:
@@ -113,6 +184,7 @@ def create_event(event: CalendarEvent) -> CalendarEvent:
         calendarId="primary", 
         body=event.model_dump(exclude_none=True, exclude_defaults=True)
     ).execute()
+    SessionCache.get_instance().invalidate(UPCOMING_EVENTS_KEY)
     logger.info(f"[MCP] - Creating Event: {event.summary}")
     return CalendarEvent(**created)
 
@@ -132,6 +204,7 @@ def delete_event(event_id: str) -> None:
     # Call the Calendar API
     try:
         service.events().delete(calendarId="primary", eventId=event_id).execute()
+        SessionCache.get_instance().invalidate(UPCOMING_EVENTS_KEY)
         logger.info(f"[MCP] - Deleted Event: {event_id}")
     except Exception as e:
         logger.error(f"[MCP] - Error deleting event: {event_id}")
@@ -159,6 +232,7 @@ def update_event(event_id: str,event: CalendarEvent) -> CalendarEvent:
             eventId=event_id, 
             body=event.model_dump(exclude_none=True, exclude_defaults=True)
         ).execute()
+        SessionCache.get_instance().invalidate(UPCOMING_EVENTS_KEY)
         logger.info(f"[MCP] - Updated Event: {event.summary}")
         return CalendarEvent(**updated)
     except Exception as e:
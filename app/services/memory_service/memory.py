@@ -4,13 +4,15 @@ import logging
 import os
 import warnings
 
-from typing import Any, Union
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import Any, Optional, Union
 
 from dotenv import load_dotenv
 from mem0 import MemoryClient
 
 from autogen import ConversableAgent
 from ..calendar_service.sdk import CalendarSDK
+from ..session_service.cache import MEMORIES_KEY, SessionCache
 
 logger = logging.getLogger(__name__)
 load_dotenv()
@@ -30,7 +32,8 @@ calendar_sdk = CalendarSDK(
 class MemoryService:
     _instance = None
 
-    def __init__(self):
+    def __init__(self, search_timeout: float = float(os.getenv("MEMORY_SEARCH_TIMEOUT_SECONDS", "2"))):
+        self.search_timeout = search_timeout
         self.memory_client = MemoryClient(api_key=os.getenv("MEM0AI_API_KEY"))
         self.user_name = self._get_user_info() if self._get_user_info() else "user"
 
@@ -46,13 +49,31 @@ class MemoryService:
     def retreive_conversation_history(self,agent: ConversableAgent, messages: list[dict[str, Any]]) -> None:  
         try:
             logger.info(f"[MemoryService] - Retrieving conversation history for {agent.name}")
-            relevant_memories = self.memory_client.search(messages[len(messages) - 1]["content"], user_id=self.user_name)
+            warm_memories = SessionCache.get_instance().pop(MEMORIES_KEY)
+            relevant_memories = self._search_memories(messages[len(messages) - 1]["content"], warm_memories)
             flatten_relevant_memories = "\n".join([m["memory"] for m in relevant_memories])
 
             agent.update_system_message(agent.system_message.format(context=flatten_relevant_memories))
         except Exception as e:
             logger.error(f"[MemoryService] - Error retreiving conversation history: {e}")
 
+    def _search_memories(self, query: str, warm_memories: Optional[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+        if not warm_memories:
+            return self.memory_client.search(query, user_id=self.user_name)
+
+        # With broad memories warmed up on connect, the first query of a session does
+        # not wait on a slow or failing search for more relevant ones
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(self.memory_client.search, query, user_id=self.user_name)
+        executor.shutdown(wait=False)
+        try:
+            return future.result(timeout=self.search_timeout)
+        except TimeoutError:
+            logger.info(f"[MemoryService] - Memory search took over {self.search_timeout}s, using warmed-up memories")
+        except Exception as e:
+            logger.error(f"[MemoryService] - Error searching memories, using warmed-up memories: {e}")
+        return warm_memories
+
     def log_conversation_to_mem0(self, message: Union[str, list[dict[str, Any]]]) -> str:
         if isinstance(message, list):
             msg_text = message[-1].get("content")
@@ -0,0 +1,91 @@
+"""Per-Session Cache Service."""
+
+import logging
+import os
+import threading
+import time
+
+from typing import Any, Optional
+
+from dotenv import load_dotenv
+
+
+logger = logging.getLogger(__name__)
+load_dotenv()
+
+MEMORIES_KEY = "memories"
+UPCOMING_EVENTS_KEY = "upcoming_events"
+TIME_ZONE_KEY = "time_zone"
+
+
+class SessionCache:
+    """Short-lived cache of context warmed up for the current connection.
+
+    Entries expire after `ttl` seconds and the whole cache is cleared whenever a
+    connection opens or closes. Anything that should survive a reconnect has to be
+    carried over with `snapshot()` and `restore()`.
+    """
+
+    _instance = None
+
+    def __init__(self, ttl: float = float(os.getenv("SESSION_CACHE_TTL_SECONDS", "300"))):
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, Any]] = {}
+        self._invalidated_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+
+        logger.info(f"[SessionCache] - Cache hit for {key}")
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None, fetched_at: Optional[float] = None) -> None:
+        with self._lock:
+            # A value fetched before the key was invalidated is already stale
+            if fetched_at is not None and fetched_at <= self._invalidated_at.get(key, 0.0):
+                logger.info(f"[SessionCache] - Discarding {key}, invalidated since it was fetched")
+                return
+            self._entries[key] = (time.time() + (self.ttl if ttl is None else ttl), value)
+
+    def pop(self, key: str) -> Optional[Any]:
+        value = self.get(key)
+        with self._lock:
+            self._entries.pop(key, None)
+        return value
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._invalidated_at[key] = time.time()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._invalidated_at.clear()
+
+    def snapshot(self) -> dict[str, tuple[float, Any]]:
+        now = time.time()
+        with self._lock:
+            return {key: entry for key, entry in self._entries.items() if entry[0] > now}
+
+    def restore(self, snapshot: dict[str, tuple[float, Any]]) -> None:
+        now = time.time()
+        with self._lock:
+            for key, (expires_at, value) in snapshot.items():
+                if expires_at > now:
+                    self._entries[key] = (expires_at, value)
+
+    @classmethod
+    def get_instance(cls) -> 'SessionCache':
+        if cls._instance is None:
+            cls._instance = SessionCache()
+        return cls._instance
@@ -0,0 +1,164 @@
+"""Connection Warm-Up Service."""
+
+import datetime
+import logging
+import os
+import threading
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from dotenv import load_dotenv
+from googleapiclient.discovery import build
+
+from ..calendar_service.mcp import calendar_sdk
+from ..memory_service.memory import MemoryService
+from .cache import MEMORIES_KEY, UPCOMING_EVENTS_KEY, SessionCache
+
+
+logger = logging.getLogger(__name__)
+load_dotenv()
+
+BROAD_MEMORY_QUERY = "The user's preferences, routines, schedule and upcoming plans"
+
+
+class PrefetchService:
+    """Speculatively warms the session cache as soon as a connection opens.
+
+    Warm-up tasks only get `window` seconds: once it elapses (or `cancel()` is
+    called) pending tasks are dropped and late results are discarded, so an idle
+    connection costs at most one round of requests. A window of 0 disables it.
+    """
+
+    def __init__(
+        self,
+        cache: SessionCache,
+        window: float = float(os.getenv("PREFETCH_WINDOW_SECONDS", "10")),
+        event_days: int = int(os.getenv("PREFETCH_EVENT_DAYS", "7")),
+        event_limit: int = int(os.getenv("PREFETCH_EVENT_LIMIT", "50")),
+    ):
+        self.cache = cache
+        self.window = window
+        self.event_days = event_days
+        self.event_limit = event_limit
+        self._executor = None
+        self._futures: list[Future] = []
+        self._timer = None
+        self._deadline = 0.0
+        self._cancelled = threading.Event()
+        self._cancel_lock = threading.Lock()
+
+    def start(self, resumed: bool = False) -> None:
+        if self.window <= 0:
+            return
+
+        # Anything restored from a previous connection is still warm, and a resumed
+        # conversation is past the first message the broad memory search stands in for
+        tasks = {
+            key: fetch
+            for key, fetch in [
+                (MEMORIES_KEY, self._fetch_memories),
+                (UPCOMING_EVENTS_KEY, self._fetch_upcoming_events),
+            ]
+            if self.cache.get(key) is None and not (resumed and key == MEMORIES_KEY)
+        }
+        if UPCOMING_EVENTS_KEY in tasks and not self._authenticate():
+            del tasks[UPCOMING_EVENTS_KEY]
+        if not tasks:
+            return
+
+        logger.info(f"[PrefetchService] - Starting warm-up tasks for {list(tasks)} (window={self.window}s)")
+        self._deadline = time.monotonic() + self.window
+        self._executor = ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="prefetch")
+        self._futures = [self._executor.submit(self._run, key, fetch) for key, fetch in tasks.items()]
+
+        self._timer = threading.Timer(self.window, self.cancel)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def cancel(self) -> None:
+        # Called by both the window timer and the connection closing
+        with self._cancel_lock:
+            if self._cancelled.is_set():
+                return
+            self._cancelled.set()
+
+        if self._timer is not None:
+            self._timer.cancel()
+
+        if self._executor is not None:
+            pending = sum(1 for future in self._futures if not future.done())
+            if pending:
+                logger.info(f"[PrefetchService] - Cancelling {pending} pending warm-up task(s)")
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _authenticate(self) -> bool:
+        # Resolve credentials before any worker thread needs them, so an expired or
+        # missing token is never refreshed (or re-authorized) by two threads at once
+        try:
+            calendar_sdk.credentials
+            return True
+        except Exception as e:
+            logger.error(f"[PrefetchService] - Error authenticating, skipping events warm-up: {e}")
+            return False
+
+    def _run(self, key: str, fetch: Callable[[], Any]) -> None:
+        if self._cancelled.is_set():
+            return
+
+        fetched_at = time.time()
+        try:
+            value = fetch()
+        except Exception as e:
+            logger.error(f"[PrefetchService] - Error warming up {key}: {e}")
+            return
+
+        if self._cancelled.is_set() or time.monotonic() > self._deadline:
+            logger.info(f"[PrefetchService] - Discarding {key}, warm-up window elapsed")
+            return
+
+        self.cache.set(key, value, fetched_at=fetched_at)
+        logger.info(f"[PrefetchService] - Warmed up {key}")
+
+    def _fetch_memories(self) -> list[dict[str, Any]]:
+        memory_service = MemoryService.get_instance()
+        return memory_service.memory_client.search(BROAD_MEMORY_QUERY, user_id=memory_service.user_name)
+
+    def _fetch_upcoming_events(self) -> dict[str, Any]:
+        # Start from midnight so questions about "today" are covered too, whichever
+        # way the tool call interprets the day boundary (local time or UTC)
+        now = datetime.datetime.now().astimezone()
+        local_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        utc_midnight = now.astimezone(datetime.timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        time_min = min(local_midnight, utc_midnight).astimezone(datetime.timezone.utc)
+        time_max = now.astimezone(datetime.timezone.utc) + datetime.timedelta(days=self.event_days)
+
+        # The calendar tools' client (and its httplib2 connection) is not thread-safe,
+        # so the worker shares only the credentials and builds its own
+        service = build("calendar", "v3", credentials=calendar_sdk.credentials)
+
+        # Call the Calendar API
+        response = (
+            service.events()
+            .list(
+                calendarId="primary",
+                timeMin=time_min.isoformat(),
+                timeMax=time_max.isoformat(),
+                maxResults=self.event_limit,
+                singleEvents=True,
+                orderBy="startTime",
+            )
+            .execute()
+        )
+        events = response.get("items", [])
+
+        return {
+            "time_min": time_min.isoformat(),
+            "time_max": time_max.isoformat(),
+            # All-day events are bounded by midnight in the calendar's own time zone
+            "time_zone": response.get("timeZone"),
+            "items": events,
+            # A full page means later events in the window may have been cut off
+            "complete": len(events) < self.event_limit,
+        }
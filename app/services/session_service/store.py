@@ -0,0 +1,120 @@
+"""Persistent Conversation State Service."""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from typing import Any, Optional
+
+from dotenv import load_dotenv
+
+
+logger = logging.getLogger(__name__)
+load_dotenv()
+
+
+class SessionStore:
+    """Checkpoints conversation state to a local SQLite database, keyed by session ID.
+
+    Sessions that have not been saved for `ttl` seconds are evicted, as are the
+    oldest sessions beyond `max_sessions`. Each saved state keeps at most
+    `max_messages` messages and `max_bytes` of JSON, dropping cached context and
+    then the oldest messages; a state that still does not fit is not saved.
+    """
+
+    _instance = None
+
+    def __init__(
+        self,
+        db_path: str = os.getenv("SESSION_STORE_PATH", "app/sessions/sessions.db"),
+        ttl: float = float(os.getenv("SESSION_TTL_SECONDS", "86400")),
+        max_sessions: int = int(os.getenv("SESSION_MAX_COUNT", "100")),
+        max_messages: int = int(os.getenv("SESSION_MAX_MESSAGES", "100")),
+        max_bytes: int = int(os.getenv("SESSION_MAX_BYTES", "1000000")),
+    ):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, state TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        self._connection.commit()
+
+    def load(self, session_id: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT state FROM sessions WHERE session_id = ? AND updated_at > ?",
+                (session_id, time.time() - self.ttl),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        logger.info(f"[SessionStore] - Loaded session {session_id}")
+        return json.loads(row[0])
+
+    def save(self, session_id: str, state: dict[str, Any]) -> None:
+        state = dict(state)
+        state["messages"] = self._trim_messages(list(state.get("messages", []))[-self.max_messages:])
+        state["cache"] = dict(state.get("cache", {}))
+
+        # Cached context can be fetched again, so it goes before any messages do,
+        # largest entries first
+        serialized = json.dumps(state)
+        while len(serialized.encode()) > self.max_bytes and state["cache"]:
+            del state["cache"][max(state["cache"], key=lambda key: len(json.dumps(state["cache"][key])))]
+            serialized = json.dumps(state)
+
+        had_messages = bool(state["messages"])
+        while len(serialized.encode()) > self.max_bytes and state["messages"]:
+            state["messages"] = self._trim_messages(state["messages"][1:])
+            serialized = json.dumps(state)
+
+        # Keep the previous checkpoint rather than one that would resume as a new chat
+        if len(serialized.encode()) > self.max_bytes or (had_messages and not state["messages"]):
+            logger.error(f"[SessionStore] - Session {session_id} does not fit in {self.max_bytes} bytes, not saving")
+            return
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, state, updated_at) VALUES (?, ?, ?)",
+                (session_id, serialized, time.time()),
+            )
+            self._evict()
+            self._connection.commit()
+
+        logger.info(f"[SessionStore] - Saved session {session_id} ({len(state['messages'])} messages)")
+
+    def _trim_messages(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # Tool responses are only valid after the tool call that requested them
+        while messages and messages[0].get("role") == "tool":
+            messages = messages[1:]
+        return messages
+
+    def _evict(self) -> None:
+        self._connection.execute("DELETE FROM sessions WHERE updated_at <= ?", (time.time() - self.ttl,))
+        self._connection.execute(
+            "DELETE FROM sessions WHERE session_id NOT IN "
+            "(SELECT session_id FROM sessions ORDER BY updated_at DESC, rowid DESC LIMIT ?)",
+            (self.max_sessions,),
+        )
+
+    @classmethod
+    def get_instance(cls) -> 'SessionStore':
+        if cls._instance is None:
+            cls._instance = SessionStore()
+        return cls._instance
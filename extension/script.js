@@ -1,4 +1,11 @@
-const ws = new WebSocket("ws://localhost:8080/ws");
+// Keep the same session across popups so the server can resume the conversation
+let sessionId = localStorage.getItem("sessionId");
+if (!sessionId) {
+  sessionId = crypto.randomUUID();
+  localStorage.setItem("sessionId", sessionId);
+}
+
+const ws = new WebSocket(`ws://localhost:8080/ws?session_id=${encodeURIComponent(sessionId)}`);
 const chatWindow = document.getElementById("chat-window");
 const userInput = document.getElementById("user-input");
 const sendBtn = document.getElementById("send-btn");
@@ -1,8 +1,13 @@
+import datetime
+
+from zoneinfo import ZoneInfo
+
 import pytest
 from fastmcp import Client
 
-from app.services.calendar_service.mcp import mcp
+from app.services.calendar_service.mcp import calendar_sdk, get_cached_events, mcp
 from app.services.calendar_service.models import CalendarEvent
+from app.services.session_service.cache import TIME_ZONE_KEY, UPCOMING_EVENTS_KEY, SessionCache
 
 
 @pytest.mark.asyncio
@@ -20,3 +25,109 @@ async def test_create_event():
         created_event = await tools.call_tool("create_event", arguments={"event": event})
         print(created_event)
     assert True
+
+
+def warm_events_cache(now: datetime.datetime) -> dict:
+    event = {
+        "id": "cached",
+        "summary": "A cached event",
+        "start": {"dateTime": (now + datetime.timedelta(hours=1)).isoformat()},
+        "end": {"dateTime": (now + datetime.timedelta(hours=2)).isoformat()},
+    }
+    SessionCache.get_instance().set(UPCOMING_EVENTS_KEY, {
+        "time_min": (now - datetime.timedelta(hours=1)).isoformat(),
+        "time_max": (now + datetime.timedelta(days=7)).isoformat(),
+        "time_zone": "UTC",
+        "items": [event],
+        "complete": True,
+    })
+    return event
+
+
+def test_get_cached_events():
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    event = warm_events_cache(now)
+
+    try:
+        assert get_cached_events(now, now + datetime.timedelta(days=1)) == [event]
+        assert get_cached_events(now, limit=1) == [event]
+        # Not enough cached events to satisfy the limit
+        assert get_cached_events(now, limit=5) is None
+        # Outside of the warmed-up window
+        assert get_cached_events(now - datetime.timedelta(days=1), now) is None
+        assert get_cached_events(now, now + datetime.timedelta(days=8)) is None
+    finally:
+        SessionCache.get_instance().clear()
+
+
+def test_get_cached_events_all_day_events_use_calendar_time_zone():
+    day = datetime.datetime(2026, 10, 19, tzinfo=datetime.timezone.utc)
+    previous_day_event = {
+        "id": "all-day",
+        "summary": "Yesterday, all day",
+        "start": {"date": "2026-10-18"},
+        "end": {"date": "2026-10-19"},
+    }
+    cached = {
+        "time_min": (day - datetime.timedelta(days=2)).isoformat(),
+        "time_max": (day + datetime.timedelta(days=7)).isoformat(),
+        "time_zone": "America/New_York",
+        "items": [previous_day_event],
+        "complete": True,
+    }
+    SessionCache.get_instance().set(UPCOMING_EVENTS_KEY, cached)
+
+    try:
+        # In New York the event ends at 05:00 UTC, so the API returns it for a query
+        # starting at midnight UTC, and so must the cache
+        assert get_cached_events(day, day + datetime.timedelta(days=1)) == [previous_day_event]
+        assert get_cached_events(day + datetime.timedelta(hours=5), day + datetime.timedelta(days=1)) == []
+
+        # Without the calendar's time zone all-day boundaries are unknown
+        SessionCache.get_instance().set(UPCOMING_EVENTS_KEY, {**cached, "time_zone": None})
+        assert get_cached_events(day, day + datetime.timedelta(days=1)) is None
+    finally:
+        SessionCache.get_instance().clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tool,arguments", [
+    ("create_event", {"event": {"summary": "Lunch", "start": {"date": "2025-07-08"}, "end": {"date": "2025-07-09"}}}),
+    ("update_event", {"event_id": "cached", "event": {"summary": "Lunch", "start": {"date": "2025-07-08"}, "end": {"date": "2025-07-09"}}}),
+    ("delete_event", {"event_id": "cached"}),
+])
+async def test_writes_invalidate_cached_events(mocker, monkeypatch, tool: str, arguments: dict):
+    service = mocker.MagicMock()
+    service.events().insert().execute.return_value = arguments.get("event")
+    service.events().update().execute.return_value = arguments.get("event")
+    monkeypatch.setattr(calendar_sdk, "_resource", service, raising=False)
+
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    warm_events_cache(now)
+
+    try:
+        async with Client(mcp) as tools:
+            await tools.call_tool(tool, arguments=arguments)
+
+        assert SessionCache.get_instance().get(UPCOMING_EVENTS_KEY) is None
+        assert get_cached_events(now, now + datetime.timedelta(days=1)) is None
+        # The next checkpoint must not carry the stale week over to a resumed session
+        assert UPCOMING_EVENTS_KEY not in SessionCache.get_instance().snapshot()
+    finally:
+        SessionCache.get_instance().clear()
+
+
+@pytest.mark.asyncio
+async def test_get_current_datetime_pins_time_zone_name(mocker):
+    mocker.patch("app.services.calendar_service.mcp.tzlocal.get_localzone_name", return_value="America/New_York")
+
+    try:
+        async with Client(mcp) as tools:
+            result = await tools.call_tool("get_current_datetime", arguments={})
+
+        # The zone is pinned by name, so its offset follows daylight saving changes
+        assert SessionCache.get_instance().get(TIME_ZONE_KEY) == "America/New_York"
+        expected_offset = datetime.datetime.now(tz=ZoneInfo("America/New_York")).strftime("%z")
+        assert result[0].text.endswith(expected_offset)
+    finally:
+        SessionCache.get_instance().clear()
@@ -0,0 +1,99 @@
+import copy
+import sqlite3
+import time
+
+import pytest
+from autogen import ConversableAgent, OpenAIWrapper
+
+from app.agents import assistant_agent, execution_agent, groupchat, groupchat_manager, user_proxy
+from app.main import load_conversation, resume_conversation
+from app.services.session_service.cache import TIME_ZONE_KEY, SessionCache
+from app.services.session_service.store import SessionStore
+
+
+# As checkpointed from GroupChat.messages, which stores every content as a string
+MESSAGES = [
+    {"role": "user", "name": "UserProxy", "content": "What's on today?"},
+    {
+        "role": "assistant",
+        "name": "AssistantAgent",
+        "content": "",
+        "tool_calls": [{"id": "call_1", "type": "function", "function": {"name": "get_current_datetime", "arguments": "{}"}}],
+    },
+    {
+        "role": "tool",
+        "name": "ExecutionAgent",
+        "content": "2026-10-19 09:00:00",
+        "tool_responses": [{"tool_call_id": "call_1", "role": "tool", "content": "2026-10-19 09:00:00"}],
+    },
+    {"role": "user", "name": "AssistantAgent", "content": "You have nothing on today."},
+]
+
+
+def test_resume_conversation(mocker):
+    generate_reply = mocker.patch.object(ConversableAgent, "generate_reply")
+    a_generate_reply = mocker.patch.object(ConversableAgent, "a_generate_reply")
+    create = mocker.patch.object(OpenAIWrapper, "create")
+
+    system_message = assistant_agent.system_message
+    state = {
+        "messages": MESSAGES,
+        "system_message": "Resumed system message",
+        "cache": {TIME_ZONE_KEY: [float("inf"), "Europe/Zurich"]},
+    }
+
+    try:
+        assert resume_conversation(copy.deepcopy(state))
+
+        generate_reply.assert_not_called()
+        a_generate_reply.assert_not_called()
+        create.assert_not_called()
+
+        assert groupchat.messages == MESSAGES
+        for agent in [execution_agent, assistant_agent, user_proxy]:
+            history = agent.chat_messages[groupchat_manager]
+            assert [m.get("content") for m in history] == [m["content"] for m in MESSAGES]
+
+        # resume() holds back the last message; it is delivered by hand, as the
+        # speaker's own message to the manager and as the manager's to everyone else
+        last_content = MESSAGES[-1]["content"]
+        assert assistant_agent.chat_messages[groupchat_manager][-1] == {
+            "content": last_content, "name": "AssistantAgent", "role": "assistant"
+        }
+        for agent in [execution_agent, user_proxy]:
+            assert agent.chat_messages[groupchat_manager][-1] == {
+                "content": last_content, "name": "AssistantAgent", "role": "user"
+            }
+        assert groupchat_manager.chat_messages[assistant_agent][-1]["content"] == last_content
+
+        assert assistant_agent.system_message == "Resumed system message"
+        assert SessionCache.get_instance().get(TIME_ZONE_KEY) == "Europe/Zurich"
+    finally:
+        assistant_agent.update_system_message(system_message)
+        groupchat.reset()
+        groupchat_manager.clear_history()
+        for agent in groupchat.agents:
+            agent.clear_history()
+        SessionCache.get_instance().clear()
+
+
+@pytest.mark.parametrize("row", ["{not json", "[]"])
+def test_load_conversation_with_unreadable_row(tmp_path, monkeypatch, row: str):
+    store = SessionStore(db_path=str(tmp_path / "sessions.db"))
+    store._connection.execute(
+        "INSERT INTO sessions (session_id, state, updated_at) VALUES (?, ?, ?)",
+        ("session", row, time.time()),
+    )
+    store._connection.commit()
+    monkeypatch.setattr(SessionStore, "_instance", store)
+
+    # A broken checkpoint starts a new conversation instead of failing the connection
+    assert load_conversation("session") is None
+
+
+def test_load_conversation_without_store(monkeypatch):
+    def broken_store():
+        raise sqlite3.OperationalError("unable to open database file")
+
+    monkeypatch.setattr(SessionStore, "get_instance", broken_store)
+    assert load_conversation("session") is None
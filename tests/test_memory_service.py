@@ -0,0 +1,49 @@
+import time
+
+from app.services.memory_service.memory import MemoryService
+from app.services.session_service.cache import MEMORIES_KEY, SessionCache
+
+
+def make_memory_service(mocker) -> MemoryService:
+    memory_service = MemoryService.__new__(MemoryService)
+    memory_service.memory_client = mocker.MagicMock()
+    memory_service.user_name = "user"
+    memory_service.search_timeout = 0.1
+    return memory_service
+
+
+def test_search_is_preferred_over_warm_memories(mocker):
+    memory_service = make_memory_service(mocker)
+    memory_service.memory_client.search.return_value = [{"memory": "Dentist is Dr. Smith"}]
+    SessionCache.get_instance().set(MEMORIES_KEY, [{"memory": "Prefers mornings"}])
+
+    agent = mocker.MagicMock(system_message="Context:{context}")
+    memory_service.retreive_conversation_history(agent, [{"content": "What's my dentist's name?"}])
+
+    memory_service.memory_client.search.assert_called_once_with("What's my dentist's name?", user_id="user")
+    agent.update_system_message.assert_called_once_with("Context:Dentist is Dr. Smith")
+    assert SessionCache.get_instance().get(MEMORIES_KEY) is None
+
+
+def test_warm_memories_are_used_when_search_fails(mocker):
+    memory_service = make_memory_service(mocker)
+    memory_service.memory_client.search.side_effect = Exception("mem0 is down")
+    SessionCache.get_instance().set(MEMORIES_KEY, [{"memory": "Prefers mornings"}])
+
+    agent = mocker.MagicMock(system_message="Context:{context}")
+    memory_service.retreive_conversation_history(agent, [{"content": "What's my dentist's name?"}])
+
+    agent.update_system_message.assert_called_once_with("Context:Prefers mornings")
+
+
+def test_warm_memories_are_used_when_search_is_slow(mocker):
+    memory_service = make_memory_service(mocker)
+    memory_service.memory_client.search.side_effect = lambda *args, **kwargs: time.sleep(1) or []
+    SessionCache.get_instance().set(MEMORIES_KEY, [{"memory": "Prefers mornings"}])
+
+    agent = mocker.MagicMock(system_message="Context:{context}")
+    started = time.monotonic()
+    memory_service.retreive_conversation_history(agent, [{"content": "What's my dentist's name?"}])
+
+    assert time.monotonic() - started < 0.5
+    agent.update_system_message.assert_called_once_with("Context:Prefers mornings")
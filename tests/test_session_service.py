@@ -0,0 +1,208 @@
+import threading
+import time
+
+from concurrent.futures import wait
+
+from app.services.session_service.cache import MEMORIES_KEY, UPCOMING_EVENTS_KEY, SessionCache
+from app.services.calendar_service.mcp import calendar_sdk
+from app.services.session_service.prefetch import PrefetchService
+from app.services.session_service.store import SessionStore
+
+
+def test_session_cache_get_set():
+    cache = SessionCache(ttl=60)
+    cache.set("key", {"value": 1})
+    assert cache.get("key") == {"value": 1}
+    assert cache.get("missing") is None
+
+
+def test_session_cache_expires_entries():
+    cache = SessionCache(ttl=0.01)
+    cache.set("key", "value")
+    time.sleep(0.02)
+    assert cache.get("key") is None
+
+
+def test_session_cache_pop_and_clear():
+    cache = SessionCache(ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.pop("a") == 1
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert cache.get("b") is None
+
+
+def test_session_cache_discards_values_fetched_before_invalidation():
+    cache = SessionCache(ttl=60)
+    fetched_at = time.time()
+    cache.invalidate("key")
+    cache.set("key", "stale", fetched_at=fetched_at)
+    assert cache.get("key") is None
+
+    cache.set("key", "fresh", fetched_at=time.time())
+    assert cache.get("key") == "fresh"
+
+
+def test_session_cache_snapshot_and_restore():
+    cache = SessionCache(ttl=60)
+    cache.set("key", "value")
+    cache.set("pinned", "value", ttl=float("inf"))
+
+    restored = SessionCache(ttl=60)
+    restored.restore(cache.snapshot())
+    assert restored.get("key") == "value"
+    assert restored.get("pinned") == "value"
+
+
+def test_session_store_save_and_load(tmp_path):
+    store = SessionStore(db_path=str(tmp_path / "sessions.db"))
+    state = {"messages": [{"role": "user", "name": "UserProxy", "content": "Hi"}], "cache": {}}
+    store.save("session", state)
+
+    assert store.load("session") == state
+    assert store.load("missing") is None
+
+
+def test_session_store_limits_messages(tmp_path):
+    store = SessionStore(db_path=str(tmp_path / "sessions.db"), max_messages=2)
+    messages = [
+        {"role": "user", "name": "UserProxy", "content": "What's on today?"},
+        {"role": "assistant", "name": "AssistantAgent", "content": None, "tool_calls": []},
+        {"role": "tool", "name": "ExecutionAgent", "content": "[]"},
+        {"role": "user", "name": "AssistantAgent", "content": "Nothing today."},
+    ]
+    store.save("session", {"messages": messages})
+
+    # A leading tool response without its tool call is dropped as well
+    assert store.load("session")["messages"] == messages[3:]
+
+
+def test_session_store_drops_cache_before_messages(tmp_path):
+    store = SessionStore(db_path=str(tmp_path / "sessions.db"), max_bytes=200)
+    messages = [{"role": "user", "name": "UserProxy", "content": "Hi"}]
+    cache = {"upcoming_events": [time.time() + 60, {"items": ["x" * 500]}], "time_zone": [time.time() + 60, "UTC"]}
+    store.save("session", {"messages": messages, "cache": cache})
+
+    state = store.load("session")
+    assert state["messages"] == messages
+    assert state["cache"] == {"time_zone": cache["time_zone"]}
+
+
+def test_session_store_skips_state_over_limit(tmp_path):
+    store = SessionStore(db_path=str(tmp_path / "sessions.db"), max_bytes=200)
+    messages = [{"role": "user", "name": "UserProxy", "content": "Hi"}]
+    store.save("session", {"messages": messages, "cache": {}})
+
+    # Even without messages or cache this would not fit, so the previous checkpoint is kept
+    store.save("session", {"messages": messages, "system_message": "x" * 500, "cache": {}})
+    assert store.load("session")["messages"] == messages
+
+    store.save("other", {"messages": messages, "system_message": "x" * 500, "cache": {}})
+    assert store.load("other") is None
+
+
+def test_session_store_evicts_sessions(tmp_path):
+    store = SessionStore(db_path=str(tmp_path / "sessions.db"), max_sessions=1)
+    store.save("old", {"messages": []})
+    store.save("new", {"messages": []})
+    assert store.load("old") is None
+    assert store.load("new") is not None
+
+    expired = SessionStore(db_path=str(tmp_path / "expired.db"), ttl=0)
+    expired.save("session", {"messages": []})
+    assert expired.load("session") is None
+
+
+def make_prefetch(mocker, window: float, fetch_memories, fetch_events=lambda: {"items": []}):
+    prefetch = PrefetchService(SessionCache(ttl=60), window=window)
+    mocker.patch.object(prefetch, "_authenticate", return_value=True)
+    mocker.patch.object(prefetch, "_fetch_memories", side_effect=fetch_memories)
+    mocker.patch.object(prefetch, "_fetch_upcoming_events", side_effect=fetch_events)
+    return prefetch
+
+
+def test_prefetch_warms_cache(mocker):
+    prefetch = make_prefetch(mocker, window=10, fetch_memories=lambda: [{"memory": "Prefers mornings"}])
+    prefetch.start()
+    wait(prefetch._futures)
+    prefetch.cancel()
+
+    assert prefetch.cache.get(MEMORIES_KEY) == [{"memory": "Prefers mornings"}]
+    assert prefetch.cache.get(UPCOMING_EVENTS_KEY) == {"items": []}
+
+
+def test_prefetch_disabled_with_zero_window(mocker):
+    prefetch = make_prefetch(mocker, window=0, fetch_memories=lambda: [])
+    prefetch.start()
+    prefetch.cancel()
+
+    prefetch._fetch_memories.assert_not_called()
+    prefetch._fetch_upcoming_events.assert_not_called()
+    assert prefetch._executor is None
+
+
+def test_prefetch_skips_memories_when_resumed(mocker):
+    prefetch = make_prefetch(mocker, window=10, fetch_memories=lambda: [])
+    prefetch.start(resumed=True)
+    wait(prefetch._futures)
+    prefetch.cancel()
+
+    prefetch._fetch_memories.assert_not_called()
+    assert prefetch.cache.get(MEMORIES_KEY) is None
+
+
+def test_prefetch_discards_results_after_window(mocker):
+    def slow_fetch():
+        time.sleep(0.2)
+        return [{"memory": "Prefers mornings"}]
+
+    prefetch = make_prefetch(mocker, window=0.05, fetch_memories=slow_fetch, fetch_events=slow_fetch)
+    prefetch.start()
+    wait(prefetch._futures)
+
+    # The window timer cancelled the warm-up while the fetches were in flight
+    assert prefetch._cancelled.is_set()
+    assert prefetch.cache.get(MEMORIES_KEY) is None
+    assert prefetch.cache.get(UPCOMING_EVENTS_KEY) is None
+
+
+def test_prefetch_discards_results_after_cancel(mocker):
+    release = threading.Event()
+
+    def blocked_fetch():
+        release.wait()
+        return [{"memory": "Prefers mornings"}]
+
+    prefetch = make_prefetch(mocker, window=10, fetch_memories=blocked_fetch, fetch_events=blocked_fetch)
+    prefetch.start()
+    prefetch.cancel()
+    # Cancelling again, as the timer and the closing connection both may, is a no-op
+    prefetch.cancel()
+
+    release.set()
+    wait(prefetch._futures)
+
+    assert prefetch.cache.get(MEMORIES_KEY) is None
+    assert prefetch.cache.get(UPCOMING_EVENTS_KEY) is None
+
+
+def test_prefetch_events_use_their_own_client(mocker, monkeypatch):
+    shared_resource = mocker.MagicMock()
+    credentials = mocker.MagicMock()
+    monkeypatch.setattr(calendar_sdk, "_resource", shared_resource, raising=False)
+    monkeypatch.setattr(calendar_sdk, "_credentials", credentials, raising=False)
+    build = mocker.patch("app.services.session_service.prefetch.build")
+    build.return_value.events().list().execute.return_value = {"items": [], "timeZone": "Europe/Zurich"}
+
+    prefetch = PrefetchService(SessionCache(ttl=60), window=10)
+    mocker.patch.object(prefetch, "_fetch_memories", return_value=[])
+    prefetch.start()
+    wait(prefetch._futures)
+    prefetch.cancel()
+
+    build.assert_called_with("calendar", "v3", credentials=credentials)
+    assert shared_resource.mock_calls == []
+    assert prefetch.cache.get(UPCOMING_EVENTS_KEY)["items"] == []
+    assert prefetch.cache.get(UPCOMING_EVENTS_KEY)["time_zone"] == "Europe/Zurich"